@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Callable, Optional, Any
+from typing import Callable, Optional, Any, Tuple, Type
+import random
 import time
 import logging
 
@@ -11,22 +12,30 @@ class RetryPolicy:
     multiplier: float = 2.0
     max_attempts: int = 4
     max_delay: float = 60.0
+    # Only these exception types are retried; anything else (TypeError, KeyError, ...) fails fast.
+    # RuntimeError is deliberately absent: NotImplementedError, RecursionError and many library
+    # errors subclass it. Callers add their own transient types (e.g. NavigationError).
+    retry_on: Tuple[Type[BaseException], ...] = (TimeoutError, ConnectionError)
+    # Decorrelated jitter keeps concurrent scrapers from retrying in lockstep
+    jitter: bool = True
 
 def with_retry(func: Callable[[], Any], policy: RetryPolicy, on_retry: Optional[Callable[[int, float, Exception], None]] = None) -> Any:
     """Execute func with exponential backoff retry logic.
  
     func: zero-arg callable that may raise exceptions on failure.
-    policy: RetryPolicy controlling delays and attempts.
+    policy: RetryPolicy controlling delays, attempts and which exceptions are retried;
+        exceptions outside policy.retry_on propagate immediately.
     on_retry: optional callback(attempt_number, delay_seconds, exception) for observability.
     """
     attempt = 0
     delay = policy.initial_delay
     last_exc: Optional[Exception] = None
+    start = time.monotonic()
 
     while attempt < policy.max_attempts:
         try:
             return func()
-        except Exception as e:
+        except policy.retry_on as e:
             last_exc = e
             attempt += 1
             # If we've exhausted attempts, re-raise the last exception
@@ -41,9 +50,12 @@ def with_retry(func: Callable[[], Any], policy: RetryPolicy, on_retry: Optional[
                 except Exception:
                     logger.exception("with_retry: on_retry callback raised an exception")
  
-            logger.warning(f"Retry {attempt}/{policy.max_attempts} after {delay}s: {e}")
+            logger.warning(f"Retry {attempt}/{policy.max_attempts} after {delay:.2f}s ({time.monotonic() - start:.1f}s elapsed): {e}")
             time.sleep(delay)
-            delay = min(delay * policy.multiplier, policy.max_delay)
+            if policy.jitter:
+                delay = min(random.uniform(policy.initial_delay, delay * policy.multiplier), policy.max_delay)
+            else:
+                delay = min(delay * policy.multiplier, policy.max_delay)
 
     # Defensive: if loop exits unexpectedly, raise last seen exception
     if last_exc:
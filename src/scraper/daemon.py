@@ -0,0 +1,317 @@
+# Long-running scraper daemon that keeps browsers alive across polls
+import logging
+import os
+import queue
+import shutil
+import socket
+import socketserver
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .claude_scraper import ClaudeUsageScraper, DEFAULT_PROFILE_DIR, HTTP_FAST_PATH_TIMEOUT, cleanup_profile_locks, error_payload, profile_session_file
+from .session_manager import load_session
+from .utils import dumps_json
+
+logger = logging.getLogger("scraper.daemon")
+
+DEFAULT_SOCKET_PATH = "./scraper/scraper.sock"
+
+
+def _env_pool_size(default: int = 2) -> int:
+    """CLAUDE_POOL_SIZE as a positive int; `default` when unset or invalid (never raises at import)."""
+    raw = os.environ.get("CLAUDE_POOL_SIZE")
+    if not raw:
+        return default
+    try:
+        size = int(raw)
+    except ValueError:
+        size = 0
+    if size < 1:
+        logger.warning("daemon: ignoring invalid CLAUDE_POOL_SIZE=%r; using %d", raw, default)
+        return default
+    return size
+
+
+DEFAULT_POOL_SIZE = _env_pool_size()
+
+
+class DriverPool:
+    """
+    Bounded pool of live browsers, checked out one per poll so concurrent polls overlap their
+    navigation waits and each browser's cold start is paid once over the pool's lifetime.
+
+    Browsers are created lazily by `factory` (at most `size` exist at a time) and checked for
+    liveness with a cheap driver.title probe before reuse. A driver whose poll raised is
+    disposed instead of returned. Cookies are deliberately kept between uses: every slot polls
+    the same account, and wiping them would force a session restore on each checkout.
+
+    Usage:
+      pool = DriverPool(lambda: ClaudeUsageScraper.create_session_driver(load_session()))
+      with pool.acquire() as driver:
+          ClaudeUsageScraper.poll_usage(driver)
+      pool.close()
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = DEFAULT_POOL_SIZE, dispose: Optional[Callable[[Any], None]] = None):
+        if size < 1:
+            raise ValueError("DriverPool size must be at least 1")
+        self.size = size
+        self._factory = factory
+        self._dispose = dispose or self._quit
+        # LIFO so the most recently used (warmest) browser is handed out first
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _alive(driver) -> bool:
+        try:
+            driver.title
+            return True
+        except Exception:
+            return False
+
+    def _checkout(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return self._factory()
+            if self._alive(driver):
+                return driver
+            logger.info("daemon: pooled browser is gone; replacing it")
+            self._dispose(driver)
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """Check out a browser, blocking while all `size` browsers are in use."""
+        self._slots.acquire()
+        driver = None
+        try:
+            driver = self._checkout()
+            yield driver
+        except BaseException:
+            # Start the next poll from a fresh browser rather than a possibly wedged one
+            if driver is not None:
+                self._dispose(driver)
+                driver = None
+            raise
+        finally:
+            if driver is not None:
+                self._idle.put(driver)
+            self._slots.release()
+
+    def clear(self) -> int:
+        """Dispose every idle browser (in-use ones are untouched); returns how many were closed."""
+        closed = 0
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return closed
+            self._dispose(driver)
+            closed += 1
+
+    def close(self) -> None:
+        self.clear()
+
+
+class _PollRequestHandler(socketserver.StreamRequestHandler):
+    """One command per connection; replies with a single JSON line."""
+
+    def handle(self):
+        daemon = self.server.scraper_daemon
+        cmd = self.rfile.readline(1024).decode("utf-8", "replace").strip().lower() or "poll"
+        if cmd == "poll":
+            resp = daemon.poll()
+        elif cmd == "ping":
+            resp = {"status": "alive"}
+        elif cmd == "shutdown":
+            resp = {"status": "shutting_down"}
+            # shutdown() blocks until serve_forever returns, so it cannot run on the handler thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            resp = error_payload("unknown_command", f"unknown daemon command: {cmd}")
+        self.wfile.write(dumps_json(resp) + b"\n")
+
+
+class ScraperDaemon:
+    """
+    Keeps Chrome instances alive between polls (a DriverPool of `pool_size` browsers) so only
+    the first poll on each pays the browser cold start. Requests arrive over a Unix domain
+    socket and are handled concurrently:
+
+      poll      -> one JSON line with the extracted payload (or a structured error)
+      ping      -> {"status": "alive"}, without touching a browser
+      shutdown  -> stop serving
+
+    serve() refuses to start when another daemon answers on the socket path and only
+    replaces a stale socket file.
+
+    Idle browsers are quit after `idle_timeout` seconds without a request and are
+    recreated lazily on the next poll. The session is read from profile_path's session file
+    (see profile_session_file) and every pooled browser runs in its own temporary
+    user-data-dir under profile_path, removed when the browser is quit.
+
+    Usage:
+      from src.scraper.daemon import ScraperDaemon
+      d = ScraperDaemon(timeout=30)
+      d.serve("./scraper/scraper.sock")
+      ...
+      d.close()
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        idle_timeout: int = 600,
+        profile_path: str = DEFAULT_PROFILE_DIR,
+        use_http: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        http_timeout: float = HTTP_FAST_PATH_TIMEOUT,
+    ):
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.profile_path = profile_path
+        self.use_http = use_http
+        self.http_timeout = http_timeout
+        self._pool = DriverPool(self._new_driver, size=pool_size, dispose=self._quit_driver)
+        self._timer_lock = threading.Lock()
+        self._idle_timer: Optional[threading.Timer] = None
+
+    def _load_session(self) -> Optional[Dict[str, Any]]:
+        """The saved session for profile_path (written by --login --profile-dir)."""
+        if self.profile_path == DEFAULT_PROFILE_DIR:
+            return load_session()
+        return load_session(profile_session_file(self.profile_path))
+
+    def _new_driver(self):
+        # Each pooled browser gets its own user-data-dir under the profile (the session is restored
+        # from cookies); two Chromes on one --user-data-dir would fight over its lock.
+        Path(self.profile_path).mkdir(parents=True, exist_ok=True)
+        user_data_dir = tempfile.mkdtemp(prefix="daemon-", dir=self.profile_path)
+        try:
+            # No pre-create sweep: it would match (and kill) the other pool browsers mid-poll
+            return ClaudeUsageScraper.create_session_driver(self._load_session(), headless=False, profile_path=user_data_dir, pre_create_cleanup=False)
+        except BaseException:
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise
+
+    def _quit_driver(self, driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        # Only clean up the browser's own user-data-dir; the shared profile path would also match siblings
+        user_data_dir = getattr(driver, "user_data_dir", None)
+        if not user_data_dir:
+            return
+        try:
+            cleanup_profile_locks(user_data_dir)
+        except Exception:
+            logger.exception("daemon: post-quit cleanup failed")
+        # The per-browser dir only held this browser's state
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+
+    def _reap_idle(self) -> None:
+        closed = self._pool.clear()
+        if closed:
+            logger.info("daemon: %d browser(s) idle for %ss; quit", closed, self.idle_timeout)
+
+    def _arm_idle_timer(self) -> None:
+        with self._timer_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+            if self.idle_timeout and self.idle_timeout > 0:
+                self._idle_timer = threading.Timer(self.idle_timeout, self._reap_idle)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+
+    def poll(self) -> Dict[str, Any]:
+        """Run one poll on a pooled browser, reusing a live one when available."""
+        sess = self._load_session()
+        if not sess:
+            return error_payload("session_required", "No valid session", details="no saved session found")
+        if self.use_http:
+            data = ClaudeUsageScraper.fetch_usage_http(sess, timeout=self.http_timeout)
+            if data is not None:
+                return data
+        diag = None
+        try:
+            with self._pool.acquire() as driver:
+                try:
+                    return ClaudeUsageScraper.poll_usage(driver, timeout=self.timeout)
+                finally:
+                    diag = getattr(driver, "scraper_diagnostics", None)
+        except Exception as e:
+            logger.exception("daemon: poll failed")
+            return error_payload("navigation_failed", "navigation or extraction failed after retries", details=str(e), diagnostics=diag)
+        finally:
+            self._arm_idle_timer()
+
+    def serve(self, socket_path: str = DEFAULT_SOCKET_PATH) -> None:
+        """Serve polls on a Unix domain socket until a shutdown command arrives."""
+        if not hasattr(socketserver, "UnixStreamServer"):
+            raise RuntimeError("daemon mode requires Unix domain socket support on this platform")
+        path = Path(socket_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() or path.is_symlink():
+            if not path.is_socket():
+                raise RuntimeError(f"{path} exists and is not a socket; refusing to replace it")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            probe.settimeout(2)
+            try:
+                probe.connect(str(path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Stale socket left behind by a previous run
+                probe.close()
+                path.unlink()
+            else:
+                try:
+                    # An empty request counts as a poll; ping is answered without touching a browser.
+                    # Read the reply so the live daemon's write doesn't hit a closed socket.
+                    probe.sendall(b"ping\n")
+                    probe.recv(1024)
+                except OSError:
+                    pass  # a busy or wedged listener still owns the path
+                finally:
+                    probe.close()
+                raise RuntimeError(f"another daemon is already serving on {path}")
+        server = socketserver.ThreadingUnixStreamServer(str(path), _PollRequestHandler, bind_and_activate=False)
+        try:
+            server.server_bind()
+            # poll returns authenticated usage data and shutdown stops the daemon: owner only.
+            # The socket is not listening yet, so nobody can connect before the mode is set.
+            os.chmod(path, 0o600)
+            server.server_activate()
+        except BaseException:
+            server.server_close()
+            raise
+        server.daemon_threads = True
+        server.scraper_daemon = self
+        logger.info("daemon: serving on %s", path)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            logger.info("daemon: stopped")
+
+    def close(self) -> None:
+        with self._timer_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+        self._pool.close()
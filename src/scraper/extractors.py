@@ -1,5 +1,5 @@
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Dict, Any, Iterator, List
+from datetime import datetime, timezone
 from bs4 import BeautifulSoup
 import re
 
@@ -20,11 +20,14 @@ Rewritten extractor that avoids lxml to simplify local testing environments
 
 class UsageExtractor:
     PERCENT_RE = re.compile(r"(\d{1,3})\s*%")
+    WIDTH_RE = re.compile(r"width\s*:\s*(\d{1,3})\s*%?")
 
     def __init__(self, html: str):
         self.html = html or ""
         # Use the built-in parser to avoid requiring lxml in test environments.
         self.soup = BeautifulSoup(self.html, "html.parser")
+        # extract_all() results for this page; the HTML never changes after construction
+        self._extracted: Optional[List[Dict[str, Any]]] = None
 
     def _by_css(self, selector: str) -> Optional[str]:
         if not selector:
@@ -74,7 +77,7 @@ class UsageExtractor:
         # Look for inline style width: XX% on elements (progress bars)
         for el in self.soup.find_all(style=True):
             style = el.get("style") or ""
-            m = re.search(r"width\s*:\s*(\d{1,3})\s*%?", style)
+            m = self.WIDTH_RE.search(style)
             if m:
                 return f"{m.group(1)}% used"
         return None
@@ -92,10 +95,10 @@ class UsageExtractor:
         m = self.PERCENT_RE.search(window)
         return m.group(0) if m else None
 
-    def extract_component(self, component_id: str) -> Dict[str, Any]:
+    def extract_component(self, component_id: str, scraped_at: Optional[datetime] = None) -> Dict[str, Any]:
         cfg = SELECTORS.get(component_id, {})
         label = cfg.get("label_text", component_id)
-        scraped_at = datetime.utcnow()
+        scraped_at = scraped_at or datetime.now(timezone.utc)
         raw_text = None
         percent = None
         selector_used = None
@@ -207,8 +210,24 @@ class UsageExtractor:
             "selector_used": selector_used,
         }
 
-    def extract_all(self) -> List[Dict[str, Any]]:
-        results: List[Dict[str, Any]] = []
-        for comp in SELECTORS.keys():
-            results.append(self.extract_component(comp))
-        return results
\ No newline at end of file
+    def iter_components(self, scraped_at: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one fresh component dict per configured component, extracting lazily on the first
+        pass (a consumer that stops early leaves the rest unextracted) and from the cache after.
+        """
+        # One timestamp for the whole page: the components come from the same snapshot
+        scraped_at = scraped_at or datetime.now(timezone.utc)
+        if self._extracted is not None:
+            for c in self._extracted:
+                yield dict(c, scraped_at=scraped_at)
+            return
+        extracted = []
+        for comp in SELECTORS:
+            c = self.extract_component(comp, scraped_at=scraped_at)
+            extracted.append(c)
+            yield dict(c)
+        self._extracted = extracted
+
+    def extract_all(self, scraped_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        # Repeat calls reuse the first pass and only restamp scraped_at
+        return list(self.iter_components(scraped_at))
\ No newline at end of file
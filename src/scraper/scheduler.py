@@ -2,7 +2,7 @@
 import logging
 import os
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 import time
 from typing import Optional
 
@@ -13,8 +13,9 @@ except Exception:
     BackgroundScheduler = None
     IntervalTrigger = None
 
-from .claude_scraper import ClaudeUsageScraper, DEFAULT_PROFILE_DIR
+from .claude_scraper import ClaudeUsageScraper, DEFAULT_PROFILE_DIR, NavigationError, configure_logging
 from .storage import Storage
+from .utils import isoformat_z
 
 # Try to import optional retry_handler.retry decorator
 try:
@@ -27,6 +28,10 @@ logger = logging.getLogger(__name__)
 DATA_DIR = os.environ.get("CLAUDE_SCRAPER_DATA_DIR", "./scraper/data")
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# Scrape history kept in the DB: one week at the default 5-minute interval. Older rows are pruned
+# after each insert so the table (and every history query over it) stays bounded.
+MAX_HISTORY_ROWS = 2016
+
 def _default_retry(retries=3, backoff=2.0):
     def decorator(fn):
         def wrapped(*args, **kwargs):
@@ -63,9 +68,10 @@ class ScraperScheduler:
       s.stop()
     """
 
-    def __init__(self, interval_minutes: int = 5, profile_path: Optional[str] = DEFAULT_PROFILE_DIR):
+    def __init__(self, interval_minutes: int = 5, profile_path: Optional[str] = DEFAULT_PROFILE_DIR, max_rows: Optional[int] = MAX_HISTORY_ROWS):
         self.interval_minutes = interval_minutes
         self.profile_path = profile_path
+        self.max_rows = max_rows
         if BackgroundScheduler is None:
             raise RuntimeError("APScheduler is not available; install apscheduler to use ScraperScheduler")
         self._sched = BackgroundScheduler()
@@ -80,25 +86,38 @@ class ScraperScheduler:
             driver = ClaudeUsageScraper.create_driver(headless=False, profile_path=self.profile_path)
             ok = ClaudeUsageScraper.navigate_to_usage(driver, timeout=30, poll=2.0)
             if not ok:
-                raise RuntimeError("Failed to navigate to usage page or challenge not cleared")
+                raise NavigationError("Failed to navigate to usage page or challenge not cleared")
             payload = ClaudeUsageScraper.extract_live_data(driver)
             # Add collector timestamp (UTC ISO)
-            collected_at = datetime.utcnow().isoformat() + "Z"
+            now = datetime.now(timezone.utc)
+            collected_at = isoformat_z(now)
             record = {
                 "collected_at": collected_at,
                 "payload": payload,
             }
             # Persist using Storage backend
+            storage = None
             try:
                 storage = Storage()
                 scrape_id = storage.insert_scrape_result(record)
                 logger.info("Scrape succeeded, stored result id=%s db=%s", scrape_id, storage.db_path)
             except Exception:
                 # Fallback to file write if DB is unavailable
-                fname = os.path.join(DATA_DIR, f"usage_{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.json")
+                fname = os.path.join(DATA_DIR, f"usage_{now.strftime('%Y%m%dT%H%M%SZ')}.json")
                 with open(fname, "w", encoding="utf-8") as fh:
                     json.dump(record, fh, indent=2, ensure_ascii=False)
                 logger.exception("DB write failed; wrote results to file %s", fname)
+            else:
+                if self.max_rows is not None:
+                    try:
+                        pruned = storage.prune(max_rows=self.max_rows)
+                        if pruned:
+                            logger.debug("Pruned %d scrape(s) beyond max_rows=%d", pruned, self.max_rows)
+                    except Exception:
+                        logger.exception("Pruning scrape history failed")
+            finally:
+                if storage is not None:
+                    storage.close()
             return record
         finally:
             if driver is not None:
@@ -131,6 +150,7 @@ class ScraperScheduler:
         return getattr(self._sched, "running", False)
 
 def create_and_start(interval_minutes: int = 5, profile_path: Optional[str] = DEFAULT_PROFILE_DIR) -> ScraperScheduler:
+    configure_logging()
     s = ScraperScheduler(interval_minutes=interval_minutes, profile_path=profile_path)
     s.start()
     return s
\ No newline at end of file
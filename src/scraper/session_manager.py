@@ -2,8 +2,9 @@
 import json
 import time
 import logging
-import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from .utils import contains_percentage, dumps_json, loads_json
 
 SESSION_FILE_DEFAULT = Path("./scraper/chrome-profile/session.json")
 
@@ -14,10 +15,13 @@ def _ensure_profile_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def save_session(driver, session_file: str = str(SESSION_FILE_DEFAULT)) -> None:
+def save_session(driver, session_file: str = str(SESSION_FILE_DEFAULT)) -> Optional[Dict[str, Any]]:
     """
     Save driver cookies and minimal metadata to session_file atomically.
     Best-effort: does not fail on non-critical errors.
+
+    Returns the saved session dict, or None if it could not be written, so callers don't
+    need to read the file straight back.
     """
     sf = Path(session_file)
     _ensure_profile_dir(sf)
@@ -66,12 +70,18 @@ def save_session(driver, session_file: str = str(SESSION_FILE_DEFAULT)) -> None:
     # Persist atomically, but log any file write failures
     tmp = sf.with_suffix(".tmp")
     try:
-        with tmp.open("w", encoding="utf-8") as fh:
-            json.dump(session, fh, indent=2, ensure_ascii=False)
+        tmp.write_bytes(dumps_json(session, indent=True))
         tmp.replace(sf)
     except Exception as e:
         log_event("ERROR", {"msg": "session_save_error", "component": "file_write", "error": str(e)})
         # best-effort: do not raise to preserve existing behavior
+        return None
+    # Prime load_session's cache so the next load in this process skips the parse
+    try:
+        st = sf.stat()
+        _SESSION_CACHE[str(sf)] = (_cache_key(st), session)
+    except OSError:
+        pass
 
     # Final success/info event with metadata
     try:
@@ -93,17 +103,38 @@ def save_session(driver, session_file: str = str(SESSION_FILE_DEFAULT)) -> None:
             bool(session.get("user_agent")),
             session.get("profile_path"),
         )
+    return dict(session)
+
+
+# Parsed sessions keyed by path -> ((st_ino, st_mtime_ns, st_size), data). Long-running callers (the
+# daemon) load the session on every poll; while the file is unchanged this costs one stat() instead of a parse.
+_SESSION_CACHE: Dict[str, Any] = {}
+
+
+def _cache_key(st) -> Tuple[int, int, int]:
+    # save_session replaces the file atomically, so a new inode catches a rewrite that lands within
+    # the filesystem's mtime granularity with the same size (e.g. a refreshed cookie value)
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
 
 
 def load_session(session_file: str = str(SESSION_FILE_DEFAULT)) -> Optional[Dict[str, Any]]:
     sf = Path(session_file)
-    if not sf.exists():
-        return None
     try:
-        with sf.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
-    except Exception:
+        st = sf.stat()
+    except OSError:
         return None
+    key = _cache_key(st)
+    cached = _SESSION_CACHE.get(str(sf))
+    if cached is None or cached[0] != key:
+        try:
+            data = loads_json(sf.read_bytes())
+        except Exception:
+            return None
+        cached = (key, data)
+        _SESSION_CACHE[str(sf)] = cached
+    data = cached[1]
+    # Shallow copy so callers adding keys don't leak into the cache
+    return dict(data) if isinstance(data, dict) else data
 
 
 def is_session_expired(session_data: Dict[str, Any], max_age_days: int = 7) -> bool:
@@ -116,6 +147,26 @@ def is_session_expired(session_data: Dict[str, Any], max_age_days: int = 7) -> b
         return True
 
 
+_SIGN_IN_MARKERS = ("sign in", "log in", "please sign in")
+
+
+def _page_source_lower(driver) -> str:
+    return (getattr(driver, "page_source", "") or "").lower()
+
+
+def _has_sign_in_markers(src: str) -> bool:
+    return any(m in src for m in _SIGN_IN_MARKERS)
+
+
+def _usage_indicators(src: str) -> Tuple[bool, bool]:
+    """(has_percentage, has_usage_text) for a lowercased page source; either one counts as logged in."""
+    return contains_percentage(src), ("usage" in src and "limit" in src)
+
+
+def _logged_in() -> Dict[str, object]:
+    return {"valid": True, "reason": "logged_in", "requires_manual_login": False}
+
+
 def validate_session(driver, timeout: int = 60, use_profile: bool = False) -> Dict[str, object]:
     """
     Validate an active browser session and return structured result.
@@ -128,7 +179,7 @@ def validate_session(driver, timeout: int = 60, use_profile: bool = False) -> Di
         try:
             log_event("warning", {"msg": "validate_session_result", "valid": False, "reason": reason, "requires_manual_login": manual})
         except Exception:
-            logger.debug(f"validate_session: result(valid=False reason={reason} requires_manual={manual})")
+            logger.debug("validate_session: result(valid=False reason=%s requires_manual=%s)", reason, manual)
         return {"valid": False, "reason": reason, "requires_manual_login": manual}
 
     try:
@@ -154,15 +205,12 @@ def validate_session(driver, timeout: int = 60, use_profile: bool = False) -> Di
                             if success:
                                 # Confirm explicit indicators in page source
                                 try:
-                                    src = (getattr(driver, "page_source", "") or "").lower()
-                                    has_percentage = bool(re.search(r"\d{1,3}\s*%", src))
-                                    has_usage_text = "usage" in src and "limit" in src
-                                    if has_percentage or has_usage_text:
-                                        return {"valid": True, "reason": "logged_in", "requires_manual_login": False}
+                                    if any(_usage_indicators(_page_source_lower(driver))):
+                                        return _logged_in()
                                     else:
                                         return _fail("no_login_indicators_after_quick_nav", True)
                                 except Exception as ex:
-                                    logger.debug(f"validate_session: error inspecting page after quick nav: {ex}")
+                                    logger.debug("validate_session: error inspecting page after quick nav: %s", ex)
                                     return _fail("inspection_error", True)
                         else:
                             try:
@@ -171,18 +219,17 @@ def validate_session(driver, timeout: int = 60, use_profile: bool = False) -> Di
                                 cur = (getattr(driver, "current_url", "") or "").lower()
                                 if "login" not in cur and "signin" not in cur:
                                     # Still mark as valid only if explicit indicators present
-                                    src = (getattr(driver, "page_source", "") or "").lower()
-                                    if re.search(r"\d{1,3}\s*%", src) or ("usage" in src and "limit" in src):
-                                        return {"valid": True, "reason": "logged_in", "requires_manual_login": False}
+                                    if any(_usage_indicators(_page_source_lower(driver))):
+                                        return _logged_in()
                                     else:
                                         return _fail("no_login_indicators_after_quick_nav", True)
                                 else:
                                     return _fail("login_url_detected", True)
                             except Exception as ex:
-                                logger.debug(f"validate_session: quick profile nav failed: {ex}")
+                                logger.debug("validate_session: quick profile nav failed: %s", ex)
                                 return _fail("navigation_error", True)
             except Exception as ex:
-                logger.debug(f"validate_session: error during quick profile cookie check: {ex}")
+                logger.debug("validate_session: error during quick profile cookie check: %s", ex)
                 # continue to full validation
 
         logger.debug("validate_session: performing full Cloudflare-aware validation")
@@ -206,21 +253,20 @@ def validate_session(driver, timeout: int = 60, use_profile: bool = False) -> Di
             start = time.time()
             while time.time() - start < inspection_timeout:
                 try:
-                    src = (getattr(driver, "page_source", "") or "").lower()
-                    if "sign in" in src or "log in" in src or "please sign in" in src:
+                    src = _page_source_lower(driver)
+                    if _has_sign_in_markers(src):
                         logger.debug("validate_session: detected sign-in markers after navigation")
                         return _fail("sign_in_markers", True)
-                    has_percentage = bool(re.search(r"\d{1,3}\s*%", src))
-                    has_usage_text = "usage" in src and "limit" in src
+                    has_percentage, has_usage_text = _usage_indicators(src)
                     if has_percentage or has_usage_text:
-                        logger.debug(f"validate_session: success (percentage={has_percentage}, usage_text={has_usage_text})")
+                        logger.debug("validate_session: success (percentage=%s, usage_text=%s)", has_percentage, has_usage_text)
                         try:
                             log_event("info", {"msg": "validate_session_success", "indicators": "chat_ui_present"})
                         except Exception:
                             logger.info("validate_session: validate success")
-                        return {"valid": True, "reason": "logged_in", "requires_manual_login": False}
+                        return _logged_in()
                 except Exception as ex:
-                    logger.debug(f"validate_session: error during final inspection: {ex}")
+                    logger.debug("validate_session: error during final inspection: %s", ex)
                 time.sleep(1)
 
             # For persistent profile, be conservative: prefer keeping browser open for manual verification
@@ -242,15 +288,13 @@ def validate_session(driver, timeout: int = 60, use_profile: bool = False) -> Di
             start = time.time()
             while time.time() - start < timeout:
                 try:
-                    src = (getattr(driver, "page_source", "") or "").lower()
-                    if "sign in" in src or "log in" in src or "please sign in" in src:
+                    src = _page_source_lower(driver)
+                    if _has_sign_in_markers(src):
                         return _fail("sign_in_markers", True)
-                    has_percentage = bool(re.search(r"\d{1,3}\s*%", src))
-                    has_usage_text = "usage" in src and "limit" in src
-                    if has_percentage or has_usage_text:
-                        return {"valid": True, "reason": "logged_in", "requires_manual_login": False}
+                    if any(_usage_indicators(src)):
+                        return _logged_in()
                 except Exception as ex:
-                    logger.debug(f"validate_session: error while inspecting page: {ex}")
+                    logger.debug("validate_session: error while inspecting page: %s", ex)
                 time.sleep(1)
 
             cur = (getattr(driver, "current_url", "") or "").lower()
@@ -268,16 +312,46 @@ def validate_session(driver, timeout: int = 60, use_profile: bool = False) -> Di
         return {"valid": False, "reason": "exception", "requires_manual_login": True}
 
 
+def _cdp_cookie(c: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a Selenium get_cookies() dict to a CDP Network.CookieParam."""
+    cookie = {"name": c.get("name"), "value": c.get("value", ""), "path": c.get("path", "/")}
+    if c.get("domain"):
+        cookie["domain"] = c.get("domain")
+    else:
+        cookie["url"] = "https://claude.ai"
+    for key in ("secure", "httpOnly"):
+        if key in c:
+            cookie[key] = bool(c[key])
+    if c.get("sameSite") in ("Strict", "Lax", "None"):
+        cookie["sameSite"] = c["sameSite"]
+    if isinstance(c.get("expiry"), (int, float)):
+        cookie["expires"] = int(c["expiry"])
+    return cookie
+
+
 def _restore_cookies(driver, session_data: Dict[str, Any]) -> bool:
     """
     Best-effort restore cookies from session_data into the browser driver.
     Returns True if at least one cookie was attempted to be added.
+
+    On Chromium drivers all cookies are set in one CDP Network.setCookies call, which does not
+    need a page on the cookie's domain; otherwise falls back to loading claude.ai and calling
+    add_cookie per cookie (an extra full page load, which may itself hit a challenge).
     """
     if not session_data:
         return False
     cookies = session_data.get("cookies", [])
     if not cookies:
         return False
+    execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+    if execute_cdp_cmd is not None:
+        params = [_cdp_cookie(c) for c in cookies if isinstance(c, dict) and c.get("name")]
+        try:
+            execute_cdp_cmd("Network.setCookies", {"cookies": params})
+            logger.debug("_restore_cookies: set %d cookie(s) via CDP", len(params))
+            return bool(params)
+        except Exception as ex:
+            logger.debug("_restore_cookies: CDP Network.setCookies failed, falling back to add_cookie: %s", ex)
     try:
         # Navigate to a high-level domain to set cookies
         try:
@@ -305,7 +379,7 @@ def _restore_cookies(driver, session_data: Dict[str, Any]) -> bool:
             except Exception:
                 # best-effort only
                 continue
-        logger.debug(f"_restore_cookies: attempted to add {added} cookie(s)")
+        logger.debug("_restore_cookies: attempted to add %d cookie(s)", added)
         return added > 0
     except Exception:
         logger.exception("_restore_cookies failed")
@@ -2,9 +2,11 @@ import os
 import sqlite3
 import json
 import threading
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any
 
+from .utils import isoformat_z
+
 DATA_DIR_ENV = "CLAUDE_SCRAPER_DATA_DIR"
 DEFAULT_DATA_DIR = "./scraper/data"
 MIGRATIONS_DIRNAME = "migrations"
@@ -81,7 +83,7 @@ class Storage:
                 cur.executescript(sql)
                 cur.execute(
                     "INSERT INTO schema_migrations (version, name, applied_at) VALUES (?, ?, ?)",
-                    (version, fname, datetime.utcnow().isoformat() + "Z"),
+                    (version, fname, isoformat_z(datetime.now(timezone.utc))),
                 )
                 self._conn.commit()
             cur.close()
@@ -91,6 +93,7 @@ class Storage:
         Insert a scrape result. `result` may be a dict (recommended) or a JSON string.
         Returns the inserted scrape id.
         """
+        now_iso = isoformat_z(datetime.now(timezone.utc))
         if isinstance(result, dict):
             data_json = json.dumps(result, ensure_ascii=False)
             payload = result.get("payload", {})
@@ -103,7 +106,7 @@ class Storage:
         scraped_at = (
             scraped_at
             or (result.get("collected_at") if isinstance(result, dict) else None)
-            or (datetime.utcnow().isoformat() + "Z")
+            or now_iso
         )
         status = payload.get("status") if isinstance(payload, dict) else None
 
@@ -111,7 +114,7 @@ class Storage:
             cur = self._conn.cursor()
             cur.execute(
                 "INSERT INTO scrapes (scraped_at, data_json, status, created_at) VALUES (?, ?, ?, ?)",
-                (scraped_at, data_json, status, datetime.utcnow().isoformat() + "Z"),
+                (scraped_at, data_json, status, now_iso),
             )
             scrape_id = cur.lastrowid
             # Attempt to insert component-level rows if available (best-effort)
@@ -176,7 +179,7 @@ class Storage:
         with self._lock:
             cur = self._conn.cursor()
             if retention_days is not None:
-                cutoff = (datetime.utcnow() - timedelta(days=retention_days)).isoformat() + "Z"
+                cutoff = isoformat_z(datetime.now(timezone.utc) - timedelta(days=retention_days))
                 cur.execute("DELETE FROM components WHERE scrape_id IN (SELECT id FROM scrapes WHERE scraped_at < ?)", (cutoff,))
                 cur.execute("DELETE FROM scrapes WHERE scraped_at < ?", (cutoff,))
                 deleted += cur.rowcount
@@ -1,12 +1,20 @@
 import re
+import json
 import logging
-from typing import Optional
-from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple
+from datetime import datetime, timezone
 import dateutil.parser
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 _PERCENT_RE = re.compile(r"(\d{1,3})\s*%")
+_CSS_FUNC_RE = re.compile(r"[a-zA-Z_][-a-zA-Z0-9_]*\s*\(")
+_NUMBER_RE = re.compile(r"(-?\d+(\.\d+)?)")
 
 def parse_percent(text: Optional[str]) -> Optional[float]:
     """
@@ -23,6 +31,53 @@ def parse_percent(text: Optional[str]) -> Optional[float]:
         return None
 
 
+def contains_percentage(text: Optional[str]) -> bool:
+    """
+    Equivalent to bool(re.search(r"\\d{1,3}\\s*%", text)) but anchored on the literal '%':
+    str.find jumps between candidates in C, so only the few bytes before each '%' are inspected
+    instead of running the regex at every position of a multi-hundred-KB page.
+    """
+    if not text:
+        return False
+    i = text.find("%")
+    while i != -1:
+        j = i - 1
+        while j >= 0 and text[j].isspace():
+            j -= 1
+        if j >= 0 and text[j].isdecimal():
+            return True
+        i = text.find("%", i + 1)
+    return False
+
+
+def iter_percentages(text: Optional[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily yield what re.findall(r"((\\d{1,3})\\s*%)", text) returns: (raw_text, digits) per match,
+    in order. Uses the contains_percentage approach of jumping between '%' characters with
+    str.find and walking back over whitespace and at most three digits; on a full settings page
+    this is several times faster than the regex, which has to attempt a match at every position.
+    """
+    if not text:
+        return
+    find = text.find
+    i = find("%")
+    while i != -1:
+        j = i - 1
+        while j >= 0 and text[j].isspace():
+            j -= 1
+        k = j
+        while k >= 0 and j - k < 3 and text[k].isdecimal():
+            k -= 1
+        if k < j:
+            yield text[k + 1:i + 1], text[k + 1:j + 1]
+        i = find("%", i + 1)
+
+
+def find_percentages(text: Optional[str]) -> List[Tuple[str, str]]:
+    """List form of iter_percentages; same result as re.findall(r"((\\d{1,3})\\s*%)", text)."""
+    return list(iter_percentages(text))
+
+
 def parse_percentage_safe(value_str: str) -> float:
     """
     Parse percentage from string, clamping to 0-100 range.
@@ -38,7 +93,7 @@ def parse_percentage_safe(value_str: str) -> float:
 
         # Handle calc() or other CSS functions (treat as complex before greedy '%' check)
         # Prefer explicit "calc(" detection; also treat any alpha+paren pattern (e.g., "min(50%)")
-        if "calc(" in lower or re.search(r"[a-zA-Z_][-a-zA-Z0-9_]*\s*\(", value_str):
+        if "calc(" in lower or _CSS_FUNC_RE.search(value_str):
             logger.warning("complex_css_value", extra={"value": value_str})
             return 0.0  # Can't reliably parse CSS functions like calc()
 
@@ -47,7 +102,7 @@ def parse_percentage_safe(value_str: str) -> float:
             # Only accept a plain numeric percentage (e.g., "50%", "50.0%")
             # Strip the percent sign and any surrounding text like "used"
             # Extract first numeric-like token
-            m = re.search(r"(-?\d+(\.\d+)?)", value_str)
+            m = _NUMBER_RE.search(value_str)
             if not m:
                 logger.error("percentage_parse_failed", extra={"value": value_str})
                 return 0.0
@@ -64,7 +119,7 @@ def parse_percentage_safe(value_str: str) -> float:
             return 0.0  # Don't interpret pixels as percentages
 
         # Plain number - clamp it
-        m = re.search(r"(-?\d+(\.\d+)?)", value_str)
+        m = _NUMBER_RE.search(value_str)
         if not m:
             logger.error("percentage_parse_failed", extra={"value": value_str})
             return 0.0
@@ -80,10 +135,44 @@ def parse_percentage_safe(value_str: str) -> float:
         return 0.0
 
 
+def isoformat_z(dt: datetime) -> str:
+    """
+    Format a UTC datetime as ISO-8601 with a trailing 'Z' (the timestamp format emitted to the
+    backend and stored in the DB). Accepts aware datetimes and naive ones already in UTC.
+    """
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.isoformat() + "Z"
+
+
 def parse_datetime(text: Optional[str]) -> Optional[datetime]:
     if not text:
         return None
     try:
         return dateutil.parser.parse(text)
     except Exception:
-        return None
\ No newline at end of file
+        return None
+
+
+def _json_default(obj: Any) -> Any:
+    # Match orjson, which writes datetimes as ISO 8601 strings
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes, using orjson when installed and the stdlib otherwise.
+    Non-ASCII characters are written as-is and datetimes become ISO 8601 strings in both cases.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes (or str) with orjson when installed, falling back to json.loads."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,68 @@
+import pytest
+
+
+class FakeDriver:
+    """
+    Stand-in for a selenium driver covering the calls the scraper makes. Records visited URLs,
+    executed scripts and added cookies; readyState probes are answered from ready_states
+    ("complete" once exhausted) and any other script returns script_result.
+    """
+
+    title = "Usage"
+    page_source = "<html><body><main>3% used</main></body></html>"
+
+    def __init__(self, page_source=None, title=None, ready_states=(), script_result=None, cookies=()):
+        if page_source is not None:
+            self.page_source = page_source
+        if title is not None:
+            self.title = title
+        self.ready_states = list(ready_states)
+        self.script_result = script_result
+        self.cookies = list(cookies)
+        self.visited = []
+        self.scripts = []
+        self.added = []
+        self.quit_called = False
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script):
+        if "readyState" in script:
+            return [self.ready_states.pop(0) if self.ready_states else "complete", self.title]
+        self.scripts.append(script)
+        return self.script_result
+
+    def add_cookie(self, cookie):
+        self.added.append(cookie)
+
+    def get_cookies(self):
+        return self.cookies
+
+    def quit(self):
+        self.quit_called = True
+
+
+class CdpDriver(FakeDriver):
+    """FakeDriver that also speaks CDP: records execute_cdp_cmd calls and returns cdp_result."""
+
+    def __init__(self, cdp_result=None, **kwargs):
+        super().__init__(**kwargs)
+        self.cdp_result = {} if cdp_result is None else cdp_result
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append((cmd, params))
+        return self.cdp_result
+
+
+@pytest.fixture
+def fake_driver():
+    """The FakeDriver class; call it with overrides, or subclass it for special behaviour."""
+    return FakeDriver
+
+
+@pytest.fixture
+def cdp_driver():
+    """The CdpDriver class (FakeDriver plus execute_cdp_cmd)."""
+    return CdpDriver
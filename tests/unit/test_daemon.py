@@ -0,0 +1,168 @@
+import json
+import os
+import socket
+import stat
+import sys
+import threading
+
+import pytest
+
+from src.scraper import daemon as daemon_mod
+from src.scraper.claude_scraper import ClaudeUsageScraper
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="daemon mode uses Unix domain sockets")
+
+
+def _request(path, cmd):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(str(path))
+        s.sendall(cmd.encode("utf-8") + b"\n")
+        return json.loads(s.makefile("rb").readline())
+
+
+def test_daemon_reuses_driver_across_polls(tmp_path, monkeypatch, fake_driver):
+    created = []
+
+    cleanups = []
+
+    def fake_create(sess, headless=False, profile_path=None, pre_create_cleanup=True):
+        d = fake_driver()
+        d.user_data_dir = profile_path
+        created.append(d)
+        cleanups.append(pre_create_cleanup)
+        return d
+
+    monkeypatch.setattr(daemon_mod, "load_session", lambda *a: {"cookies": [{"name": "sessionKey", "value": "x"}]})
+    monkeypatch.setattr(daemon_mod, "cleanup_profile_locks", lambda path: None)
+    monkeypatch.setattr(ClaudeUsageScraper, "create_session_driver", classmethod(lambda cls, *a, **kw: fake_create(*a, **kw)))
+    monkeypatch.setattr(ClaudeUsageScraper, "poll_usage", classmethod(lambda cls, driver, timeout=30: {"status": "ok", "components": []}))
+
+    d = daemon_mod.ScraperDaemon(timeout=5, idle_timeout=0, profile_path=str(tmp_path / "profile"))
+    sock = tmp_path / "scraper.sock"
+    t = threading.Thread(target=d.serve, args=(str(sock),), daemon=True)
+    t.start()
+    for _ in range(100):
+        # The socket file appears at bind, before the server listens; wait until it answers
+        # (an empty request would count as a poll, so probe with ping)
+        try:
+            _request(sock, "ping")
+            break
+        except OSError:
+            threading.Event().wait(0.01)
+
+    assert stat.S_IMODE(os.stat(sock).st_mode) == 0o600
+    assert _request(sock, "poll")["status"] == "ok"
+    assert _request(sock, "poll")["status"] == "ok"
+    assert len(created) == 1, "browser should be created once and reused"
+    assert cleanups == [False], "pooled browsers must not run the pre-create sweep"
+
+    assert _request(sock, "bogus")["error_code"] == "unknown_command"
+    # A second daemon must not steal the live socket
+    with pytest.raises(RuntimeError, match="already serving"):
+        daemon_mod.ScraperDaemon(idle_timeout=0).serve(str(sock))
+    assert _request(sock, "ping") == {"status": "alive"}
+    assert _request(sock, "shutdown")["status"] == "shutting_down"
+    t.join(timeout=5)
+    assert not t.is_alive()
+    assert not sock.exists()
+
+    d.close()
+    assert created[0].quit_called
+    assert not os.path.exists(created[0].user_data_dir), "the per-browser user-data-dir is removed on quit"
+
+
+def test_daemon_uses_profile_session_and_a_dir_per_pooled_browser(tmp_path, monkeypatch, fake_driver):
+    profile = tmp_path / "work"
+    profile.mkdir()
+    (profile / "session.json").write_text(json.dumps({"cookies": [{"name": "sessionKey", "value": "work"}]}), encoding="utf-8")
+    created = []
+
+    def fake_create(cls, sess, headless=False, profile_path=None, pre_create_cleanup=True):
+        d = fake_driver()
+        d.user_data_dir = profile_path
+        d.sess = sess
+        created.append(d)
+        return d
+
+    monkeypatch.setattr(daemon_mod, "cleanup_profile_locks", lambda path: None)
+    monkeypatch.setattr(ClaudeUsageScraper, "create_session_driver", classmethod(fake_create))
+
+    d = daemon_mod.ScraperDaemon(idle_timeout=0, profile_path=str(profile), pool_size=2)
+    with d._pool.acquire() as first, d._pool.acquire() as second:
+        assert first.sess["cookies"][0]["value"] == "work"
+        assert first.user_data_dir != second.user_data_dir
+        for drv in (first, second):
+            assert os.path.dirname(drv.user_data_dir) == str(profile) and os.path.isdir(drv.user_data_dir)
+    d.close()
+    assert not any(os.path.exists(drv.user_data_dir) for drv in created)
+    assert (profile / "session.json").exists()
+
+
+def test_serve_replaces_only_a_stale_socket(tmp_path):
+    stale = tmp_path / "stale.sock"
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.bind(str(stale))
+    s.close()  # bound but never listening: what a killed daemon leaves behind
+    d = daemon_mod.ScraperDaemon(idle_timeout=0)
+    t = threading.Thread(target=d.serve, args=(str(stale),), daemon=True)
+    t.start()
+    for _ in range(100):
+        try:
+            assert _request(stale, "ping") == {"status": "alive"}
+            break
+        except OSError:
+            threading.Event().wait(0.01)
+    assert _request(stale, "shutdown")["status"] == "shutting_down"
+    t.join(timeout=5)
+
+    regular = tmp_path / "not-a-socket"
+    regular.write_text("keep me", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="not a socket"):
+        d.serve(str(regular))
+    assert regular.read_text(encoding="utf-8") == "keep me"
+    d.close()
+
+
+def test_driver_pool_replaces_dead_and_failed_drivers(fake_driver):
+    class DeadDriver(fake_driver):
+        @property
+        def title(self):
+            raise ConnectionError("browser went away")
+
+    made = []
+
+    def factory():
+        d = fake_driver()
+        made.append(d)
+        return d
+
+    pool = daemon_mod.DriverPool(factory, size=2)
+    with pool.acquire() as a:
+        with pool.acquire() as b:
+            assert a is not b
+    with pool.acquire() as again:
+        assert again in (a, b)
+    assert len(made) == 2
+
+    with pytest.raises(RuntimeError):
+        with pool.acquire() as failed:
+            raise RuntimeError("poll blew up")
+    assert failed.quit_called
+
+    dead = DeadDriver()
+    pool._idle.put(dead)
+    with pool.acquire() as fresh:
+        assert fresh is not dead
+    assert dead.quit_called
+
+    pool.close()
+    assert all(d.quit_called for d in made)
+
+
+@pytest.mark.parametrize("raw,expected", [(None, 2), ("", 2), ("4", 4), ("many", 2), ("0", 2), ("-3", 2)])
+def test_env_pool_size_falls_back_on_invalid_values(monkeypatch, raw, expected):
+    if raw is None:
+        monkeypatch.delenv("CLAUDE_POOL_SIZE", raising=False)
+    else:
+        monkeypatch.setenv("CLAUDE_POOL_SIZE", raw)
+    assert daemon_mod._env_pool_size() == expected
@@ -1,6 +1,7 @@
 import pytest
 from src.scraper.extractors import UsageExtractor
 from src.scraper.selectors import SELECTORS
+from src.scraper.claude_scraper import extract_from_text, extract_from_text_list
 
 SAMPLE_FRAGMENT = """
 <div>
@@ -41,4 +42,29 @@ def test_missing_elements():
     ex = UsageExtractor(fragment)
     res = ex.extract_component("current_session")
     assert res["percent"] is None
-    assert res["raw_text"] == ""
\ No newline at end of file
+    assert res["raw_text"] == ""
+
+def test_extract_from_text_keeps_raw_match():
+    res = extract_from_text_list("<span>36 % used</span><span>100%</span>")
+    assert res == [
+        {"raw_text": "36 %", "percent": 36.0},
+        {"raw_text": "100%", "percent": 100.0},
+    ]
+    assert extract_from_text_list(None) == []
+
+
+def test_extract_from_text_is_lazy():
+    gen = extract_from_text("3% then 4%")
+    assert next(gen) == {"raw_text": "3%", "percent": 3.0}
+    assert [r["percent"] for r in gen] == [4.0]
+
+def test_extract_all_reuses_first_pass():
+    ex = UsageExtractor(SAMPLE_FRAGMENT)
+    first = ex.extract_all()
+    calls = []
+    ex.extract_component = lambda *a, **kw: calls.append(a)
+    second = ex.extract_all()
+    assert calls == []
+    assert [c["percent"] for c in second] == [c["percent"] for c in first]
+    second[0]["percent"] = -1
+    assert ex.extract_all()[0]["percent"] == first[0]["percent"]
@@ -0,0 +1,125 @@
+import types
+
+import pytest
+
+from src.scraper import claude_scraper as cs
+from src.scraper.claude_scraper import ClaudeUsageScraper, HTTP_FAST_PATH_TIMEOUT
+
+SESSION = {
+    "cookies": [{"name": "sessionKey", "value": "sk", "domain": ".claude.ai", "path": "/"}],
+    "user_agent": "Mozilla/5.0 test",
+}
+
+_BLOCK = (
+    '<div><p class="text-text-500 whitespace-nowrap text-sm">{}</p>'
+    '<span class="text-text-300 whitespace-nowrap w-20 text-right">{}% used</span></div>'
+)
+USAGE_HTML = "<html><body>" + "".join(
+    _BLOCK.format(label, pct) for label, pct in [("Current session", 3), ("All models", 36), ("Opus only", 12)]
+) + "</body></html>"
+
+
+# Percent-bearing pages without usage data: the extractor's fallbacks read these as 100% usage
+SHELL_HTML = '<html><body><div id="root" style="height:100%"></div><p>Loading...</p></body></html>'
+SIGN_IN_HTML = (
+    '<html><body><h1>Sign in to Claude</h1>'
+    '<div class="progress" style="width:100%"></div><button>Log in</button></body></html>'
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+class RequestException(Exception):
+    pass
+
+
+@pytest.fixture
+def http(monkeypatch):
+    """Stub requests module; set http.response (or http.error) before calling fetch_usage_http."""
+    state = types.SimpleNamespace(response=FakeResponse(), error=None, gets=[], cookies={}, headers={}, closed=False)
+
+    class Session:
+        def __init__(self):
+            self.headers = state.headers
+            self.cookies = types.SimpleNamespace(set=lambda name, value, **kw: state.cookies.__setitem__(name, (value, kw)))
+
+        def get(self, url, timeout=None):
+            state.gets.append((url, timeout))
+            if state.error is not None:
+                raise state.error
+            return state.response
+
+        def close(self):
+            state.closed = True
+
+    monkeypatch.setattr(cs, "requests", types.SimpleNamespace(Session=Session, RequestException=RequestException))
+    return state
+
+
+def test_returns_payload_when_html_has_percentages(http):
+    http.response = FakeResponse(200, USAGE_HTML)
+    data = ClaudeUsageScraper.fetch_usage_http(SESSION)
+    assert data["status"] == "ok"
+    assert [c["percent"] for c in data["components"]] == [3.0, 36.0, 12.0]
+    assert data["diagnostics"]["source"] == "http"
+    assert http.gets == [(cs.USAGE_URL, HTTP_FAST_PATH_TIMEOUT)]
+    assert http.cookies["sessionKey"] == ("sk", {"path": "/", "domain": ".claude.ai"})
+    assert http.headers["User-Agent"] == "Mozilla/5.0 test"
+    assert http.closed
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        FakeResponse(403, "<html>blocked</html>", {"cf-mitigated": "challenge"}),
+        FakeResponse(200, '<html><form action="/?__cf_chl_f_tk=abc"></form></html>'),
+        FakeResponse(500, USAGE_HTML),
+        FakeResponse(200, "<html><body><div id='root'></div></body></html>"),
+        FakeResponse(200, SHELL_HTML),
+        FakeResponse(200, SIGN_IN_HTML),
+    ],
+    ids=["cf-mitigated", "challenge-body", "non-200", "client-rendered", "percent-shell", "sign-in-progress-bar"],
+)
+def test_falls_back_to_browser(http, response):
+    http.response = response
+    assert ClaudeUsageScraper.fetch_usage_http(SESSION) is None
+    assert len(http.gets) == 1
+
+
+def test_fallback_hits_are_not_selector_backed():
+    # The browser path still reports these pages; only the fast path refuses them
+    for html in (SHELL_HTML, SIGN_IN_HTML):
+        data = ClaudeUsageScraper(html).extract_usage_data()
+        assert data["diagnostics"]["selector_backed"] is False
+    assert ClaudeUsageScraper(USAGE_HTML).extract_usage_data()["diagnostics"]["selector_backed"] is True
+
+
+def test_request_error_falls_back_to_browser(http):
+    http.error = RequestException("read timed out")
+    assert ClaudeUsageScraper.fetch_usage_http(SESSION, timeout=2) is None
+    assert http.gets == [(cs.USAGE_URL, 2)]
+    assert http.closed
+
+
+def test_skipped_without_cookies(http):
+    assert ClaudeUsageScraper.fetch_usage_http({"cookies": []}) is None
+    assert http.gets == []
+
+
+@pytest.mark.parametrize(
+    "html, auth_markers",
+    [
+        (USAGE_HTML, False),
+        (SIGN_IN_HTML, True),
+        ("<html><body><h1>Just a moment...</h1>" + USAGE_HTML + "</body></html>", True),
+    ],
+    ids=["usage", "sign-in", "challenge"],
+)
+def test_auth_markers_flag_sign_in_and_challenge_pages(html, auth_markers):
+    # poll_once only skips validate_session for selector-backed data without these markers
+    assert ClaudeUsageScraper(html).extract_usage_data()["diagnostics"]["auth_markers"] is auth_markers
@@ -0,0 +1,43 @@
+import logging
+import logging.handlers
+import threading
+
+import pytest
+
+from src.scraper import claude_scraper as cs
+
+
+@pytest.fixture
+def scraper_logger():
+    before = list(cs.logger.handlers)
+    yield cs.logger
+    for h in cs.logger.handlers:
+        if h not in before:
+            cs.logger.removeHandler(h)
+            h.close()
+    cs.shutdown_logging()
+
+
+def test_configure_logging_attaches_one_append_handler_across_threads(tmp_path, scraper_logger):
+    log_path = tmp_path / "logs" / "scraper.log"
+    barrier = threading.Barrier(8)
+
+    def configure():
+        barrier.wait()
+        cs.configure_logging(log_path)
+
+    threads = [threading.Thread(target=configure) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    added = [h for h in scraper_logger.handlers if getattr(h, "_scraper_log", False)]
+    assert len(added) == 1
+    handler = added[0]
+    assert isinstance(handler, logging.FileHandler)
+    assert not isinstance(handler, logging.handlers.BaseRotatingHandler), "other processes share the file"
+
+    scraper_logger.info("hello")
+    handler.flush()
+    assert "hello" in log_path.read_text(encoding="utf-8")
@@ -0,0 +1,195 @@
+import types
+
+import pytest
+
+from src.scraper import claude_scraper as cs
+from src.scraper.claude_scraper import ClaudeUsageScraper
+from src.scraper.utils import loads_json
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake clock: time.sleep advances time.time and records each delay."""
+    state = {"now": 0.0, "sleeps": []}
+
+    def sleep(s):
+        state["sleeps"].append(s)
+        state["now"] += s
+
+    monkeypatch.setattr(cs.time, "time", lambda: state["now"])
+    monkeypatch.setattr(cs.time, "sleep", sleep)
+    monkeypatch.setattr(ClaudeUsageScraper, "wait_for_usage_content", staticmethod(lambda driver, timeout=cs.USAGE_WAIT_TIMEOUT: True))
+    return state
+
+
+def test_challenge_poll_ramps_up_to_poll_cap(clock, monkeypatch, fake_driver):
+    checks = iter([True] * 12 + [False])
+    monkeypatch.setattr(ClaudeUsageScraper, "is_challenge_page", staticmethod(lambda driver, src=None: next(checks)))
+
+    driver = fake_driver()
+    assert ClaudeUsageScraper.navigate_to_usage(driver, timeout=60, poll=0.5, initial_poll=0.05, poll_growth=2.0)
+    assert clock["sleeps"][:4] == pytest.approx([0.05, 0.1, 0.2, 0.4])
+    assert max(clock["sleeps"]) == 0.5
+    assert driver.scraper_diagnostics["cloudflare_detected"] is False
+
+
+def test_loading_document_is_not_inspected(clock, monkeypatch, fake_driver):
+    seen = []
+
+    def is_challenge(driver, src=None):
+        seen.append(src)
+        return False
+
+    monkeypatch.setattr(ClaudeUsageScraper, "is_challenge_page", staticmethod(is_challenge))
+    driver = fake_driver(ready_states=["loading", "loading", "interactive"])
+    assert ClaudeUsageScraper.navigate_to_usage(driver, timeout=60)
+    assert seen == [driver.page_source], "challenge check should run once, on the parsed document, with its source"
+
+
+def test_challenge_title_skips_source_fetch(clock, monkeypatch, fake_driver):
+    checks = []
+    monkeypatch.setattr(ClaudeUsageScraper, "is_challenge_page", staticmethod(lambda driver, src=None: checks.append(src) or False))
+
+    driver = fake_driver(title="Just a moment...")
+    ClaudeUsageScraper.navigate_to_usage(driver, timeout=1, poll=0.5, max_attempts=1)
+    assert checks == []
+    assert driver.scraper_diagnostics["cloudflare_detected"] is True
+
+
+def test_backoff_between_attempts_is_capped(clock, monkeypatch, fake_driver):
+    monkeypatch.setattr(ClaudeUsageScraper, "is_challenge_page", staticmethod(lambda driver, src=None: True))
+
+    driver = fake_driver()
+    ok = ClaudeUsageScraper.navigate_to_usage(
+        driver, timeout=1, poll=1.0, initial_delay=10.0, multiplier=4.0, max_attempts=4, max_delay=30.0, jitter=0.0
+    )
+    assert not ok
+    backoffs = [s for s in clock["sleeps"] if s >= 10.0]
+    assert backoffs == [10.0, 30.0, 30.0]
+    assert driver.scraper_diagnostics["backoff_delays"] == backoffs
+    assert driver.scraper_diagnostics["error"] == "navigation_failed"
+
+
+def test_backoff_jitter_stays_within_bounds(clock, monkeypatch, fake_driver):
+    monkeypatch.setattr(ClaudeUsageScraper, "is_challenge_page", staticmethod(lambda driver, src=None: True))
+
+    driver = fake_driver()
+    ClaudeUsageScraper.navigate_to_usage(driver, timeout=1, poll=1.0, initial_delay=2.0, multiplier=2.0, max_attempts=4, jitter=0.5)
+    delays = driver.scraper_diagnostics["backoff_delays"]
+    assert len(delays) == 3
+    for i, d in enumerate(delays):
+        base = 2.0 * 2.0 ** i
+        assert base * 0.5 <= d <= base * 1.5
+
+
+PADDING = "<div>" + "x" * 4096 + "</div>"
+
+
+@pytest.mark.parametrize(
+    "src,expected",
+    [
+        ("<title>Just a moment...</title>" + PADDING, True),
+        ('<div id="challenge-running"></div>' + PADDING, True),
+        ('<iframe title="Widget" src="https://challenges.cloudflare.com/cdn-cgi/challenge-platform/x"></iframe>' + PADDING, True),
+        ('<script src="https://challenges.cloudflare.com/turnstile/v0/api.js"></script>' + PADDING, False),
+        (PADDING + "<main><span>36% used</span></main>", False),
+    ],
+)
+def test_is_challenge_page_scans_source(src, expected, fake_driver):
+    driver = fake_driver(page_source=src, script_result=True)
+    assert ClaudeUsageScraper.is_challenge_page(driver) is expected
+    assert driver.scripts == [], "DOM probe should be skipped for a full document"
+
+
+def test_is_challenge_page_probes_dom_for_near_empty_document(fake_driver):
+    empty = "<html><body></body></html>"
+    assert ClaudeUsageScraper.is_challenge_page(fake_driver(page_source=empty, script_result=True)) is True
+    assert ClaudeUsageScraper.is_challenge_page(fake_driver(page_source=empty, script_result=False)) is False
+
+
+def test_page_html_prefers_cdp(cdp_driver):
+    d = cdp_driver({"result": {"type": "string", "value": "<main>36% used</main>"}})
+    assert ClaudeUsageScraper._page_html(d) == "<main>36% used</main>"
+    [(cmd, params)] = d.cdp_calls
+    assert cmd == "Runtime.evaluate" and params["returnByValue"] is True
+    assert params["expression"].startswith("(() => {")
+
+
+def test_page_html_falls_back_when_cdp_expression_throws(cdp_driver):
+    d = cdp_driver(
+        {"result": {"type": "object"}, "exceptionDetails": {"text": "boom"}},
+        page_source="<html><body>webdriver</body></html>",
+        script_result="<body>execute_script</body>",
+    )
+    assert ClaudeUsageScraper._page_html(d) == "<body>execute_script</body>"
+    assert ClaudeUsageScraper._page_source(d) == "<html><body>webdriver</body></html>"
+
+
+def test_poll_usage_retries_navigation_errors_but_not_bugs(clock, monkeypatch, fake_driver):
+    results = iter([False, True])
+    monkeypatch.setattr(ClaudeUsageScraper, "navigate_to_usage", classmethod(lambda cls, driver, timeout=30, poll=2.0: next(results)))
+    monkeypatch.setattr(ClaudeUsageScraper, "extract_live_data", classmethod(lambda cls, driver: {"status": "ok"}))
+    assert ClaudeUsageScraper.poll_usage(fake_driver()) == {"status": "ok"}
+
+    calls = []
+
+    def broken(cls, driver, timeout=30, poll=2.0):
+        calls.append(1)
+        raise NotImplementedError("bug")
+
+    monkeypatch.setattr(ClaudeUsageScraper, "navigate_to_usage", classmethod(broken))
+    with pytest.raises(NotImplementedError):
+        ClaudeUsageScraper.poll_usage(fake_driver())
+    assert len(calls) == 1
+
+
+def test_poll_usage_raises_navigation_error_after_last_attempt(clock, monkeypatch, fake_driver):
+    monkeypatch.setattr(ClaudeUsageScraper, "navigate_to_usage", classmethod(lambda cls, driver, timeout=30, poll=2.0: False))
+    with pytest.raises(cs.NavigationError):
+        ClaudeUsageScraper.poll_usage(fake_driver())
+
+
+def test_emit_error_writes_one_json_line_to_stderr(capsys):
+    cs.emit_error("navigation_failed", "navigation failed", details="é", diagnostics={"cookies": ["x"], "retries": 2})
+    err = capsys.readouterr().err
+    assert err.count("\n") == 1
+    payload = loads_json(err)
+    assert payload["error_code"] == "navigation_failed"
+    assert payload["details"] == "é"
+    assert payload["diagnostics"] == {"cookies": "<redacted>", "retries": 2}
+
+
+def test_usage_wait_never_outlasts_the_navigation_budget(clock, monkeypatch, fake_driver):
+    # Challenge clears just before the 3s budget runs out, then the usage selector never appears
+    checks = iter([True] * 8 + [False])
+    monkeypatch.setattr(ClaudeUsageScraper, "is_challenge_page", staticmethod(lambda driver, src=None: next(checks)))
+    waits = []
+
+    def selector_never_appears(driver, timeout=cs.USAGE_WAIT_TIMEOUT):
+        waits.append(timeout)
+        clock["now"] += timeout
+        return False
+
+    monkeypatch.setattr(ClaudeUsageScraper, "wait_for_usage_content", staticmethod(selector_never_appears))
+    driver = fake_driver()
+    assert ClaudeUsageScraper.navigate_to_usage(driver, timeout=3, poll=0.5, max_attempts=1)
+    assert 0 < waits[0] < cs.USAGE_WAIT_TIMEOUT
+    assert clock["now"] == pytest.approx(3.0)
+    assert driver.scraper_diagnostics["usage_content_ready"] is False
+
+
+def test_wait_for_usage_content_returns_false_at_its_timeout(monkeypatch, fake_driver):
+    waited = []
+
+    class NeverPresent:
+        def __init__(self, driver, timeout):
+            waited.append(timeout)
+
+        def until(self, condition):
+            raise cs.TimeoutException("element never appeared")
+
+    monkeypatch.setattr(cs, "WebDriverWait", NeverPresent)
+    monkeypatch.setattr(cs, "EC", types.SimpleNamespace(presence_of_element_located=lambda locator: locator))
+    monkeypatch.setattr(cs, "By", types.SimpleNamespace(CSS_SELECTOR="css selector"))
+    assert ClaudeUsageScraper.wait_for_usage_content(fake_driver(), timeout=1.5) is False
+    assert waited == [1.5]
@@ -0,0 +1,84 @@
+import asyncio
+import os
+import time
+
+from src.scraper import claude_scraper as cs
+from src.scraper.claude_scraper import ClaudeUsageScraper
+from src.scraper.session_manager import load_session
+
+
+def fake_poll_profile(profile_path, timeout=30, use_http=False):
+    # Finish out of input order so ordering is not an accident of timing
+    time.sleep({"a": 0.05, "b": 0.0, "c": 0.02}.get(profile_path, 0.0))
+    if profile_path == "b":
+        return cs._profile_error("b", "session_required", "No valid session")
+    if profile_path == "c":
+        raise RuntimeError("worker died")
+    return {"status": "ok", "components": [], "profile": profile_path, "timeout": timeout}
+
+
+def crashing_poll_profile(profile_path, timeout=30, use_http=False):
+    # Runs in the worker process: "c" takes its worker down the way a segfault or OOM kill would
+    if profile_path == "c":
+        os._exit(1)
+    time.sleep(0.2)
+    return {"status": "ok", "components": [], "profile": profile_path, "timeout": timeout}
+
+
+def _check(results):
+    assert [r["profile"] for r in results] == ["a", "b", "c"]
+    assert results[0]["status"] == "ok" and results[0]["timeout"] == 7
+    assert results[1]["error_code"] == "session_required"
+    assert results[2]["error_code"] == "fatal"
+    assert results[2]["details"] == "worker died"
+
+
+def test_poll_many_collects_results_per_profile_in_order(monkeypatch):
+    monkeypatch.setattr(cs, "_poll_profile", fake_poll_profile)
+    _check(cs.poll_many(["a", "b", "c"], timeout=7))
+    assert cs.poll_many([]) == []
+
+
+def test_poll_many_worker_crash_only_fails_its_own_profile(monkeypatch):
+    monkeypatch.setattr(cs, "_poll_profile", crashing_poll_profile)
+    results = cs.poll_many(["a", "c", "d"], timeout=7, max_workers=3)
+    assert [r["profile"] for r in results] == ["a", "c", "d"]
+    assert results[0]["status"] == "ok" and results[2]["status"] == "ok"
+    assert results[1]["error_code"] == "fatal"
+
+
+def test_poll_many_async_collects_results_per_profile_in_order(monkeypatch):
+    monkeypatch.setattr(cs, "_poll_profile", fake_poll_profile)
+    _check(asyncio.run(cs.poll_many_async(["a", "b", "c"], timeout=7)))
+
+
+def test_poll_usage_async_runs_poll_usage(monkeypatch, fake_driver):
+    calls = []
+
+    def poll_usage(cls, driver, timeout=30, policy=None):
+        calls.append((driver, timeout, policy))
+        return {"status": "ok"}
+
+    monkeypatch.setattr(ClaudeUsageScraper, "poll_usage", classmethod(poll_usage))
+    driver = fake_driver()
+    assert asyncio.run(ClaudeUsageScraper.poll_usage_async(driver, timeout=5)) == {"status": "ok"}
+    assert calls == [(driver, 5, None)]
+
+
+def test_poll_profile_reads_the_profiles_own_session(tmp_path, monkeypatch):
+    monkeypatch.setattr(cs, "configure_logging", lambda *a, **kw: None)
+    result = cs._poll_profile(str(tmp_path))
+    assert result["error_code"] == "session_required"
+    assert result["profile"] == str(tmp_path)
+
+
+def test_login_with_profile_dir_saves_that_profiles_session(tmp_path, monkeypatch, fake_driver):
+    profile = str(tmp_path / "work")
+    driver = fake_driver(script_result="Mozilla/5.0 test", cookies=[{"name": "sessionKey", "value": "work"}])
+    monkeypatch.setattr(ClaudeUsageScraper, "create_driver", staticmethod(lambda **kw: driver))
+    monkeypatch.setattr("builtins.input", lambda prompt="": "")
+    monkeypatch.setattr(cs.time, "sleep", lambda s: None)
+
+    saved = ClaudeUsageScraper.manual_login(profile_path=profile)
+    assert saved["cookies"] == [{"name": "sessionKey", "value": "work"}]
+    assert load_session(cs.profile_session_file(profile))["cookies"] == saved["cookies"]
@@ -0,0 +1,63 @@
+import pytest
+
+from scraper import retry_handler
+from scraper.retry_handler import RetryPolicy, with_retry
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(retry_handler.time, "sleep", delays.append)
+    return delays
+
+
+def test_retries_transient_errors_until_success(no_sleep):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise TimeoutError("slow")
+        return "ok"
+
+    assert with_retry(flaky, RetryPolicy(jitter=False)) == "ok"
+    assert len(calls) == 3
+    assert no_sleep == [1.0, 2.0]
+
+
+def test_non_retryable_error_fails_fast(no_sleep):
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise TypeError("bug")
+
+    with pytest.raises(TypeError):
+        with_retry(broken, RetryPolicy())
+    assert len(calls) == 1
+    assert no_sleep == []
+
+
+def test_jittered_delays_stay_within_bounds(no_sleep):
+    policy = RetryPolicy(initial_delay=1.0, multiplier=2.0, max_attempts=6, max_delay=5.0)
+
+    def always_fails():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        with_retry(always_fails, policy)
+    assert len(no_sleep) == 5
+    assert all(1.0 <= d <= 5.0 for d in no_sleep)
+
+
+def test_runtime_error_subclasses_are_not_retried_by_default(no_sleep):
+    calls = []
+
+    def unfinished():
+        calls.append(1)
+        raise NotImplementedError("bug")
+
+    with pytest.raises(NotImplementedError):
+        with_retry(unfinished, RetryPolicy())
+    assert len(calls) == 1
+    assert no_sleep == []
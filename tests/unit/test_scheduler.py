@@ -0,0 +1,60 @@
+import importlib
+
+import pytest
+
+from src.scraper.claude_scraper import ClaudeUsageScraper
+from src.scraper.storage import Storage
+
+PAYLOAD = {"status": "ok", "components": [{"component_id": "current_session", "label": "Current session", "percent": 3.0}]}
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch, fake_driver):
+    """scheduler module with its data dir under tmp_path and the browser stubbed out."""
+    data_dir = tmp_path / "data"
+    monkeypatch.setenv("CLAUDE_SCRAPER_DATA_DIR", str(data_dir))
+    mod = importlib.import_module("src.scraper.scheduler")
+    monkeypatch.setattr(mod, "DATA_DIR", str(data_dir))
+    # APScheduler is optional; _run_scrape never touches the background scheduler
+    monkeypatch.setattr(mod, "BackgroundScheduler", lambda: None)
+    monkeypatch.setattr(ClaudeUsageScraper, "create_driver", staticmethod(lambda **kw: fake_driver()))
+    monkeypatch.setattr(ClaudeUsageScraper, "navigate_to_usage", staticmethod(lambda driver, **kw: True))
+    monkeypatch.setattr(ClaudeUsageScraper, "extract_live_data", classmethod(lambda cls, driver: PAYLOAD))
+    return mod
+
+
+def _seed(count):
+    storage = Storage()
+    for day in range(1, count + 1):
+        storage.insert_scrape_result({"collected_at": f"2020-01-{day:02d}T00:00:00Z", "payload": PAYLOAD})
+    return storage
+
+
+def _rows(storage):
+    return storage.list_scrapes(limit=1000)
+
+
+def test_run_scrape_prunes_history_to_max_rows(scheduler):
+    storage = _seed(5)
+    record = scheduler.ScraperScheduler(max_rows=3)._run_scrape()
+
+    rows = _rows(storage)
+    assert len(rows) == 3
+    assert rows[0]["scraped_at"] == record["collected_at"], "the row just inserted is kept"
+    assert [r["scraped_at"] for r in rows[1:]] == ["2020-01-05T00:00:00Z", "2020-01-04T00:00:00Z"]
+    storage.close()
+
+
+def test_failed_prune_keeps_new_row_without_file_fallback(scheduler, tmp_path, monkeypatch):
+    def broken_prune(self, **kw):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(Storage, "prune", broken_prune)
+    storage = _seed(2)
+    record = scheduler.ScraperScheduler(max_rows=1)._run_scrape()
+
+    rows = _rows(storage)
+    assert len(rows) == 3
+    assert rows[0]["scraped_at"] == record["collected_at"]
+    assert not list((tmp_path / "data").glob("usage_*.json")), "a failed prune must not trigger the file fallback"
+    storage.close()
@@ -0,0 +1,71 @@
+import os
+
+from src.scraper import session_manager
+from src.scraper.session_manager import _restore_cookies
+
+SESSION = {
+    "cookies": [
+        {"name": "sessionKey", "value": "sk", "domain": ".claude.ai", "path": "/", "secure": True, "httpOnly": True, "sameSite": "Lax", "expiry": 1999999999},
+        {"name": "cf_clearance", "value": "cf", "path": "/"},
+    ]
+}
+
+
+def test_restore_cookies_uses_one_cdp_call_without_navigation(cdp_driver):
+    d = cdp_driver()
+    assert _restore_cookies(d, SESSION) is True
+    assert d.visited == []
+    [(cmd, params)] = d.cdp_calls
+    assert cmd == "Network.setCookies"
+    first, second = params["cookies"]
+    assert first == {
+        "name": "sessionKey", "value": "sk", "path": "/", "domain": ".claude.ai",
+        "secure": True, "httpOnly": True, "sameSite": "Lax", "expires": 1999999999,
+    }
+    assert second == {"name": "cf_clearance", "value": "cf", "path": "/", "url": "https://claude.ai"}
+
+
+def test_restore_cookies_falls_back_to_add_cookie(fake_driver):
+    d = fake_driver()
+    assert _restore_cookies(d, SESSION) is True
+    assert d.visited == ["https://claude.ai"]
+    assert [c["name"] for c in d.added] == ["sessionKey", "cf_clearance"]
+
+
+def _cookie_driver(fake_driver):
+    d = fake_driver(script_result="Mozilla/5.0 test", cookies=[{"name": "sessionKey", "value": "sk", "domain": ".claude.ai"}])
+    d.user_data_dir = "/tmp/profile"
+    return d
+
+
+def test_save_session_returns_saved_dict_and_primes_cache(tmp_path, monkeypatch, fake_driver):
+    path = tmp_path / "session.json"
+    saved = session_manager.save_session(_cookie_driver(fake_driver), str(path))
+    assert saved["cookies"][0]["name"] == "sessionKey"
+    assert saved["user_agent"] == "Mozilla/5.0 test"
+
+    def no_parse(data):
+        raise AssertionError("session.json was re-parsed")
+
+    monkeypatch.setattr(session_manager, "loads_json", no_parse)
+    assert session_manager.load_session(str(path)) == saved
+
+
+def test_save_session_returns_none_when_write_fails(tmp_path, fake_driver):
+    target = tmp_path / "session.json"
+    target.mkdir()  # replacing a directory with a file fails
+    assert session_manager.save_session(_cookie_driver(fake_driver), str(target)) is None
+
+
+def test_load_session_sees_a_replacement_with_same_size_and_mtime(tmp_path):
+    path = tmp_path / "session.json"
+    path.write_text('{"user_agent": "a"}', encoding="utf-8")
+    st = path.stat()
+    assert session_manager.load_session(str(path)) == {"user_agent": "a"}
+
+    # Atomic rewrite (as save_session does) within the mtime granularity: only the inode differs
+    tmp = tmp_path / "session.tmp"
+    tmp.write_text('{"user_agent": "b"}', encoding="utf-8")
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    tmp.replace(path)
+    assert session_manager.load_session(str(path)) == {"user_agent": "b"}
@@ -0,0 +1,65 @@
+import re
+from datetime import datetime, timezone
+
+import pytest
+
+from src.scraper import utils
+from src.scraper.utils import contains_percentage, dumps_json, find_percentages, loads_json
+
+REFERENCE_RE = re.compile(r"\d{1,3}\s*%")
+REFERENCE_PAIR_RE = re.compile(r"((\d{1,3})\s*%)")
+
+PERCENT_TEXTS = [
+    "",
+    "no numbers here",
+    "100% %",
+    "36 % used",
+    "width: 50%",
+    "%%%",
+    "a% b %",
+    "12\n\t%",
+    "total: 1234%",
+    "x %5",
+    "<span>3% used</span>",
+    "12 3 %",
+    "5%5%%",
+    "1234 %",
+]
+
+
+@pytest.mark.parametrize("text", PERCENT_TEXTS)
+def test_contains_percentage_matches_regex(text):
+    assert contains_percentage(text) == bool(REFERENCE_RE.search(text))
+
+
+@pytest.mark.parametrize("text", PERCENT_TEXTS)
+def test_find_percentages_matches_regex(text):
+    assert find_percentages(text) == REFERENCE_PAIR_RE.findall(text)
+
+
+def test_contains_percentage_none():
+    assert contains_percentage(None) is False
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_round_trip(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson not installed")
+    payload = {"cookies": [{"name": "sessionKey", "value": "é"}], "user_agent": None}
+    for indent in (False, True):
+        raw = dumps_json(payload, indent=indent)
+        assert isinstance(raw, bytes)
+        assert "é".encode("utf-8") in raw
+        assert loads_json(raw) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_writes_datetimes_as_iso(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson not installed")
+    when = datetime(2026, 10, 16, 12, 30, 5, tzinfo=timezone.utc)
+    assert loads_json(dumps_json({"at": when})) == {"at": "2026-10-16T12:30:05+00:00"}